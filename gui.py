@@ -1,9 +1,15 @@
 from __future__ import annotations
+import array
+import bisect
+import hashlib
 import os
+import shutil
 import sys
+import tempfile
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
-from dataclasses import dataclass
 from typing import List, Optional, Tuple, Any
 
 # Third-party libraries:
@@ -31,15 +37,10 @@ except Exception:
 THUMBNAIL_MAX_WIDTH = 180
 THUMBNAIL_MAX_HEIGHT = 240
 PAGE_FRAME_PADX = 8
+PREVIEW_DPI = 18  # coarse first-pass render so the reel fills in fast
 
-
-@dataclass
-class PageItem:
-	source_path: str
-	page_index: int
-	image: Any  # PIL Image
-	photo: Any  # ImageTk.PhotoImage
-	include_var: tk.BooleanVar
+THUMB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf-page-editor")
+THUMB_CACHE_MAX_BYTES = 500 * 1024 * 1024
 
 
 class ScrollableRow(tk.Frame):
@@ -91,9 +92,16 @@ class PDFPageEditorApp(tk.Tk):
 		self.title("PDF Page Editor (Barebones)")
 		self.geometry("1100x520")
 
-		# State
-		self.pages: List[PageItem] = []
+		# Page state, struct-of-arrays: parallel lists indexed by reel position,
+		# so the reorder-heavy drag path moves small ints/refs, not whole objects
+		self._page_paths: List[str] = []
+		self._page_indices = array.array("i")
+		self._page_photos: List[Any] = []  # ImageTk.PhotoImage, None until rendered
+		self._page_thumb_sizes: List[Tuple[int, int]] = []
+		self._page_include: List[tk.BooleanVar] = []
 		self.page_frames: List[tk.Frame] = []
+		self._frame_to_index: dict = {}  # rebuilt on every layout; O(1) event lookups
+		self._current_columns: dict = {}  # frame -> gridded column, to skip no-op re-grids
 		self.selected_indices: List[int] = []  # maintain order of selection
 		self.last_clicked_index: Optional[int] = None
 
@@ -101,16 +109,42 @@ class PDFPageEditorApp(tk.Tk):
 		self.dragging: bool = False
 		self.drag_start_index: Optional[int] = None
 		self.drop_index: Optional[int] = None
-		self.insert_bar: Optional[tk.Frame] = None
+		self.insert_bar: Optional[tk.Frame] = None  # created once, moved/hidden thereafter
+		self._drag_midpoints = array.array("i")  # frame midpoints cached at drag start
+		self._pending_drag_x: Optional[int] = None  # latest motion x, applied on idle
+		self._drag_scheduled: bool = False
+
+		# Background thumbnail rendering (lazy: only pages in the viewport)
+		self._render_executor: Optional[ThreadPoolExecutor] = None
+		self._render_workers = os.cpu_count() or 1
+		self._render_tls = threading.local()  # per-thread fitz documents
+		self._render_lock = threading.Lock()
+		self._render_pending = 0  # in-flight render jobs; docs close at zero
+		self._matrix_cache: dict = {}  # rounded (w, h) -> fitz.Matrix
+		self._render_requested: set = set()  # frames already submitted to the pool
+		self._rendered_frames: set = set()  # frames currently holding a full thumbnail
+		self._frame_lefts: List[int] = []  # left x of each frame, for visibility checks
+		self._photo_pool: dict = {}  # (w, h) -> free PhotoImages, reused via paste()
+
+		# pypdf readers kept across exports, invalidated when the file changes
+		self._reader_cache: dict[str, tuple[float, Any]] = {}  # path -> (mtime, PdfReader)
 
 		# UI
 		self._build_toolbar()
 		self.row = ScrollableRow(self, height=360)
 		self.row.pack(fill=tk.BOTH, expand=True)
+		# Route scroll updates through us so newly visible pages get rendered
+		self.row.canvas.configure(xscrollcommand=self._on_reel_scrolled)
 
 		self.status = tk.StringVar(value="Ready")
 		tk.Label(self, textvariable=self.status, anchor="w").pack(fill=tk.X)
 
+		# Page-frame interactions are bound once here at class level; frames
+		# opt in via a "PageFrame" bindtag instead of per-widget closures
+		self.bind_class("PageFrame", "<Button-1>", self._on_click)
+		self.bind_class("PageFrame", "<B1-Motion>", self._on_drag)
+		self.bind_class("PageFrame", "<ButtonRelease-1>", self._on_release)
+
 		self._check_dependencies()
 
 	# ---------- UI construction ----------
@@ -119,7 +153,8 @@ class PDFPageEditorApp(tk.Tk):
 		bar.pack(fill=tk.X, pady=4)
 
 		tk.Button(bar, text="Add PDFs", command=self.on_add_pdfs).pack(side=tk.LEFT, padx=4)
-		tk.Button(bar, text="Export...", command=self.on_export).pack(side=tk.LEFT, padx=4)
+		self.export_button = tk.Button(bar, text="Export...", command=self.on_export)
+		self.export_button.pack(side=tk.LEFT, padx=4)
 
 		tk.Label(bar, text="Hint: Shift = range select, Ctrl/Cmd = toggle select, drag to reorder", fg="#555").pack(side=tk.LEFT, padx=12)
 
@@ -144,82 +179,331 @@ class PDFPageEditorApp(tk.Tk):
 			return
 		try:
 			self._import_pdfs(file_paths)
-			self.status.set(f"Loaded {len(file_paths)} file(s), total pages: {len(self.pages)}")
+			self.status.set(f"Loaded {len(file_paths)} file(s), total pages: {len(self._page_paths)}")
 		except Exception as e:
 			messagebox.showerror("Error", f"Failed to import PDFs:\n{e}")
 
 	def _import_pdfs(self, file_paths: Tuple[str, ...]):
+		if fitz is None:
+			raise RuntimeError("pymupdf not installed")
+		first_new = len(self._page_paths)
+		# Only read page geometry up front (cheap); pixels render when visible
 		for path in file_paths:
-			if fitz is None:
-				raise RuntimeError("pymupdf not installed")
 			doc = fitz.open(path)
-			for page_index in range(len(doc)):
-				page = doc.load_page(page_index)
-				pix = page.get_pixmap(matrix=self._thumbnail_matrix(page))
-				mode = "RGB" if pix.alpha == 0 else "RGBA"
-				pil_img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-				photo = ImageTk.PhotoImage(pil_img)
-				item = PageItem(
-					source_path=path,
-					page_index=page_index,
-					image=pil_img,
-					photo=photo,
-					include_var=tk.BooleanVar(value=True),
-				)
-				self.pages.append(item)
-				self._create_page_frame(len(self.pages) - 1)
-			doc.close()
+			try:
+				for page_index in range(len(doc)):
+					page = doc.load_page(page_index)
+					rect = page.rect
+					page = None  # release the MuPDF page promptly
+					scale = min(THUMBNAIL_MAX_WIDTH / rect.width, THUMBNAIL_MAX_HEIGHT / rect.height)
+					if scale <= 0:
+						scale = 0.2
+					self._page_paths.append(path)
+					self._page_indices.append(page_index)
+					self._page_photos.append(None)
+					self._page_thumb_sizes.append((max(int(rect.width * scale), 1), max(int(rect.height * scale), 1)))
+					self._page_include.append(tk.BooleanVar(value=True))
+					self._create_page_frame(len(self._page_paths) - 1)
+			finally:
+				doc.close()
 		self._layout_page_frames()
+		# Queue coarse previews for every new page, behind the visible full-res
+		# jobs the layout pass just submitted; detail fills in as it arrives
+		executor = self._get_render_executor()
+		for i in range(first_new, len(self._page_paths)):
+			frame = self.page_frames[i]
+			self._render_job_started()
+			future = executor.submit(
+				self._render_preview_worker,
+				self._page_paths[i],
+				self._page_indices[i],
+				self._page_thumb_sizes[i],
+			)
+			future.add_done_callback(lambda f, frame=frame: self._on_preview_rendered(frame, f))
+		if PdfReader is not None:
+			threading.Thread(target=self._prewarm_readers, args=(file_paths,), daemon=True).start()
+
+	def _get_render_executor(self) -> ThreadPoolExecutor:
+		if self._render_executor is None:
+			self._render_executor = ThreadPoolExecutor(max_workers=self._render_workers)
+			# One sweep per session is enough to keep the disk cache bounded
+			threading.Thread(target=self._evict_thumb_cache, daemon=True).start()
+		return self._render_executor
+
+	def _render_job_started(self):
+		with self._render_lock:
+			self._render_pending += 1
+
+	def _render_job_finished(self) -> bool:
+		# True when this was the last in-flight render job
+		with self._render_lock:
+			self._render_pending -= 1
+			return self._render_pending == 0
+
+	def _close_idle_worker_documents(self):
+		# All thumbnails are built; have the workers drop their open documents
+		# so MuPDF returns its buffers. Re-renders reopen on demand (and usually
+		# hit the disk cache anyway).
+		with self._render_lock:
+			if self._render_pending:
+				return  # more work arrived in the meantime
+		if self._render_executor is not None:
+			for _ in range(self._render_workers):
+				self._render_executor.submit(self._close_worker_documents)
+
+	def _close_worker_documents(self):
+		docs = getattr(self._render_tls, "docs", None)
+		if docs:
+			for doc in docs.values():
+				doc.close()
+			docs.clear()
+
+	def _worker_document(self, path: str):
+		# fitz documents must not be shared across threads; keep one per (thread, path)
+		docs = getattr(self._render_tls, "docs", None)
+		if docs is None:
+			docs = self._render_tls.docs = {}
+		doc = docs.get(path)
+		if doc is None:
+			doc = docs[path] = fitz.open(path)
+		return doc
+
+	def _thumb_cache_path(self, path: str, page_index: int) -> str:
+		key = f"{path}|{os.path.getmtime(path)}|{page_index}|{THUMBNAIL_MAX_WIDTH}x{THUMBNAIL_MAX_HEIGHT}"
+		return os.path.join(THUMB_CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".png")
+
+	def _evict_thumb_cache(self):
+		# Keep the cache under the size budget, dropping least-recently-used first
+		try:
+			entries = []
+			total = 0
+			with os.scandir(THUMB_CACHE_DIR) as it:
+				for entry in it:
+					st = entry.stat()
+					entries.append((st.st_mtime, st.st_size, entry.path))
+					total += st.st_size
+			entries.sort()
+			for _mtime, size, cache_path in entries:
+				if total <= THUMB_CACHE_MAX_BYTES:
+					break
+				os.remove(cache_path)
+				total -= size
+		except OSError:
+			pass
+
+	def _render_page_worker(self, path: str, page_index: int):
+		# Runs on a pool thread; only touches fitz/PIL, returns plain bytes
+		cache_path = self._thumb_cache_path(path, page_index)
+		try:
+			with Image.open(cache_path) as cached:
+				img = cached.convert("RGBA")
+			os.utime(cache_path)  # refresh recency for LRU eviction
+			return "RGBA", img.size, img.tobytes()
+		except OSError:
+			pass
+		doc = self._worker_document(path)
+		page = doc.load_page(page_index)
+		# Always render RGBA: 4-byte pixels keep rows aligned for the Tk/Pillow blit
+		pix = page.get_pixmap(matrix=self._thumbnail_matrix(page), alpha=True)
+		result = ("RGBA", (pix.width, pix.height), bytes(pix.samples))
+		pix = page = None  # hand the MuPDF buffers back before the PNG write
+		try:
+			os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
+			pil_img = Image.frombytes("RGBA", result[1], result[2])
+			# compress_level=1 keeps the write cheap; cache hits skip the PDF entirely
+			pil_img.save(cache_path, "PNG", optimize=False, compress_level=1)
+		except OSError:
+			pass
+		return result
+
+	def _render_preview_worker(self, path: str, page_index: int, thumb_size: Tuple[int, int]):
+		# Cheap low-dpi pass, upscaled to the slot size off the Tk thread
+		doc = self._worker_document(path)
+		page = doc.load_page(page_index)
+		pix = page.get_pixmap(dpi=PREVIEW_DPI, alpha=True)
+		img = Image.frombytes("RGBA", (pix.width, pix.height), pix.samples)
+		pix = page = None  # release the MuPDF buffers before the resize
+		img = img.resize(thumb_size)
+		return "RGBA", img.size, img.tobytes()
+
+	def _on_preview_rendered(self, frame: tk.Frame, future):
+		if self._render_job_finished():
+			self.after(0, self._close_idle_worker_documents)
+		# Preview failures stay quiet; the full-res pass reports real errors
+		try:
+			result = future.result()
+		except Exception:
+			return
+		self.after(0, self._finish_preview, frame, result)
+
+	def _finish_preview(self, frame: tk.Frame, result):
+		# Never overwrite a full-res thumbnail that already landed
+		if frame in self._rendered_frames:
+			return
+		mode, size, samples = result
+		photo = self._acquire_photo(Image.frombytes(mode, size, samples))
+		frame.thumb_label.configure(image=photo, bg="#ffffff")
+		frame.thumb_label.image = photo  # keep reference
+
+	def _on_page_rendered(self, frame: tk.Frame, path: str, page_index: int, future):
+		# Called on a pool thread; marshal back onto the Tk thread
+		if self._render_job_finished():
+			self.after(0, self._close_idle_worker_documents)
+		try:
+			result = future.result()
+		except Exception as e:
+			self.after(0, self.status.set, f"Failed to render {os.path.basename(path)} p{page_index + 1}: {e}")
+			return
+		self.after(0, self._finish_page, frame, result)
+
+	def _acquire_photo(self, pil_img):
+		# Reuse a pooled PhotoImage of the same size; Tk image churn is expensive
+		pool = self._photo_pool.get(pil_img.size)
+		if pool:
+			photo = pool.pop()
+			photo.paste(pil_img)
+			return photo
+		return ImageTk.PhotoImage(pil_img)
+
+	def _release_photo(self, photo):
+		if photo is not None:
+			size = (photo.width(), photo.height())
+			self._photo_pool.setdefault(size, []).append(photo)
+
+	def _finish_page(self, frame: tk.Frame, result):
+		# The frame is the stable identity: _frame_to_index tracks reorders
+		index = self._frame_to_index.get(frame)
+		if index is None:
+			return
+		mode, size, samples = result
+		# The PIL image is only scaffolding for the PhotoImage; don't keep it
+		pil_img = Image.frombytes(mode, size, samples)
+		photo = self._acquire_photo(pil_img)
+		self._page_photos[index] = photo
+		self._rendered_frames.add(frame)
+		# Recycle the coarse preview (if any) that this thumbnail replaces
+		old = getattr(frame.thumb_label, "image", None)
+		if old is not None and old is not photo:
+			self._release_photo(old)
+		frame.thumb_label.configure(image=photo, bg="#ffffff")
+		frame.thumb_label.image = photo  # keep reference
+
+	def _on_reel_scrolled(self, lo, hi):
+		self.row.hbar.set(lo, hi)
+		self._ensure_visible_rendered()
+
+	def _ensure_visible_rendered(self):
+		# Submit render jobs only for pages whose frames overlap the viewport
+		if not self._page_paths or fitz is None:
+			return
+		lo, hi = self.row.canvas.xview()
+		total = self.row.inner.winfo_width()
+		left = lo * total
+		right = hi * total
+		start = bisect.bisect_right(self._frame_lefts, left) - 1
+		if start < 0:
+			start = 0
+		executor = self._get_render_executor()
+		for i in range(start, len(self._page_paths)):
+			if i < len(self._frame_lefts) and self._frame_lefts[i] > right:
+				break
+			frame = self.page_frames[i]
+			if self._page_photos[i] is not None or frame in self._render_requested:
+				continue
+			self._render_requested.add(frame)
+			path, page_index = self._page_paths[i], self._page_indices[i]
+			self._render_job_started()
+			future = executor.submit(self._render_page_worker, path, page_index)
+			future.add_done_callback(
+				lambda f, frame=frame, path=path, page_index=page_index: self._on_page_rendered(frame, path, page_index, f)
+			)
+		self._evict_offscreen(left, right)
+
+	def _evict_offscreen(self, left: float, right: float):
+		# Keep thumbnail memory roughly constant: pages far outside the viewport
+		# go back to gray placeholders and their PhotoImages return to the pool.
+		# They re-render from the disk cache when scrolled back into view.
+		margin = 2 * (right - left)
+		for frame in list(self._rendered_frames):
+			i = self._frame_to_index.get(frame)
+			if i is None or i >= len(self._frame_lefts):
+				continue
+			x = self._frame_lefts[i]
+			if left - margin <= x <= right + margin:
+				continue
+			self._release_photo(self._page_photos[i])
+			self._page_photos[i] = None
+			frame.thumb_label.configure(image="", bg="#dee2e6")
+			frame.thumb_label.image = None
+			self._rendered_frames.discard(frame)
+			self._render_requested.discard(frame)
 
 	def _thumbnail_matrix(self, page):
-		# Compute scale to fit within the thumbnail max dimensions
+		# Page sizes are uniform within most documents; reuse one Matrix per size
 		rect = page.rect
-		width, height = rect.width, rect.height
-		scale = min(THUMBNAIL_MAX_WIDTH / width, THUMBNAIL_MAX_HEIGHT / height)
-		if scale <= 0:
-			scale = 0.2
-		return fitz.Matrix(scale, scale)
+		key = (round(rect.width, 2), round(rect.height, 2))
+		matrix = self._matrix_cache.get(key)
+		if matrix is None:
+			# Compute scale to fit within the thumbnail max dimensions
+			scale = min(THUMBNAIL_MAX_WIDTH / rect.width, THUMBNAIL_MAX_HEIGHT / rect.height)
+			if scale <= 0:
+				scale = 0.2
+			matrix = self._matrix_cache[key] = fitz.Matrix(scale, scale)
+		return matrix
 
 	def _create_page_frame(self, index: int):
-		item = self.pages[index]
 		frame = tk.Frame(self.row.inner, bd=2, relief=tk.RIDGE, bg="#f8f9fa")
 
-		thumb = tk.Label(frame, image=item.photo, bg="#ffffff")
-		thumb.image = item.photo  # keep reference
-		thumb.pack(padx=6, pady=6)
+		# Fixed-size holder so the reel lays out correctly before pixels arrive
+		tw, th = self._page_thumb_sizes[index]
+		holder = tk.Frame(frame, width=tw, height=th, bg="#dee2e6")
+		holder.pack_propagate(False)
+		holder.pack(padx=6, pady=6)
+		thumb = tk.Label(holder, bg="#dee2e6")
+		photo = self._page_photos[index]
+		if photo is not None:
+			thumb.configure(image=photo, bg="#ffffff")
+			thumb.image = photo  # keep reference
+		thumb.pack(fill=tk.BOTH, expand=True)
+		frame.thumb_label = thumb
 
 		info = tk.Frame(frame, bg="#f8f9fa")
 		info.pack(fill=tk.X, padx=6, pady=(0, 6))
 
 		tk.Checkbutton(
 			info,
-			text=f"Include p{item.page_index + 1}",
-			variable=item.include_var,
+			text=f"Include p{self._page_indices[index] + 1}",
+			variable=self._page_include[index],
 			bg="#f8f9fa",
 		).pack(side=tk.LEFT)
 
-		# Bind interactions to both frame and thumb for convenience
+		# Tag frame and thumb so the single class-level bindings (see __init__)
+		# fire for them; no per-page closures needed
 		for w in (frame, thumb):
-			w.bind("<Button-1>", lambda e, fr=frame: self._on_click(e, fr))
-			w.bind("<B1-Motion>", lambda e, fr=frame: self._on_drag(e, fr))
-			w.bind("<ButtonRelease-1>", lambda e, fr=frame: self._on_release(e, fr))
+			w.bindtags(("PageFrame",) + w.bindtags())
 
 		self.page_frames.append(frame)
 
 	def _layout_page_frames(self):
-		# Clear existing grid
+		# Only touch frames whose column actually changed; full forget/re-grid
+		# cycles make the canvas invalidate geometry N times per reorder
+		moved = False
 		for i, f in enumerate(self.page_frames):
-			f.grid_forget()
-		# Re-grid in current order
-		for i, f in enumerate(self.page_frames):
-			f.grid(row=0, column=i, padx=PAGE_FRAME_PADX, pady=8, sticky="n")
-		self.row.inner.update_idletasks()
+			if self._current_columns.get(f) != i:
+				f.grid_configure(row=0, column=i, padx=PAGE_FRAME_PADX, pady=8, sticky="n")
+				self._current_columns[f] = i
+				moved = True
+		self._frame_to_index = {f: i for i, f in enumerate(self.page_frames)}
+		if moved:
+			self.row.inner.update_idletasks()
+			self._frame_lefts = [f.winfo_x() for f in self.page_frames]
 		self._refresh_selection_visuals()
+		self._ensure_visible_rendered()
 
 	# ---------- Selection logic ----------
-	def _on_click(self, event, frame: tk.Widget):
-		# Resolve index from the frame at click-time so it's accurate after reorders
-		index = self._index_from_frame_or_child(frame)
+	def _on_click(self, event):
+		# Resolve index from the widget at click-time so it's accurate after reorders
+		index = self._index_from_frame_or_child(event.widget)
 		# Determine modifier keys
 		ctrl = (event.state & 0x0004) != 0 or (sys.platform == "darwin" and (event.state & 0x0008) != 0)
 		shift = (event.state & 0x0001) != 0
@@ -241,10 +525,15 @@ class PDFPageEditorApp(tk.Tk):
 
 		self._refresh_selection_visuals()
 
-		# Prepare for potential drag
+		# Prepare for potential drag: cache frame midpoints once, since forcing
+		# geometry updates per <B1-Motion> event is far too slow
 		self.dragging = False
 		self.drag_start_index = index
 		self.drop_index = None
+		self.row.inner.update_idletasks()
+		self._drag_midpoints = array.array(
+			"i", (f.winfo_x() + f.winfo_width() // 2 for f in self.page_frames)
+		)
 
 	def _refresh_selection_visuals(self):
 		for i, frame in enumerate(self.page_frames):
@@ -254,41 +543,39 @@ class PDFPageEditorApp(tk.Tk):
 				frame.configure(bg="#f8f9fa", bd=2, relief=tk.RIDGE)
 
 	# ---------- Drag and drop ----------
-	def _on_drag(self, event, frame: tk.Widget):
+	def _on_drag(self, event):
 		if self.drag_start_index is None:
 			return
 		# Start drag after small movement threshold
 		self.dragging = True
+		# Motion events fire faster than the UI can redraw; remember only the
+		# latest x and coalesce into a single idle callback
+		self._pending_drag_x = event.x_root
+		if not self._drag_scheduled:
+			self._drag_scheduled = True
+			self.after_idle(self._apply_drag)
+
+	def _apply_drag(self):
+		self._drag_scheduled = False
+		if self._pending_drag_x is None or self.drag_start_index is None:
+			return
 		# Compute drop index based on cursor x over the inner frame
-		x_root = event.x_root
 		inner_left = self.row.inner.winfo_rootx()
-		x_in_inner = x_root - inner_left
+		x_in_inner = self._pending_drag_x - inner_left
 		self.drop_index = self._compute_drop_index(x_in_inner)
 		self._show_insert_bar(self.drop_index)
 
 	def _compute_drop_index(self, x_in_inner: int) -> int:
-		# Find insertion position among frames by comparing x to midpoints
-		positions = []
-		for i, f in enumerate(self.page_frames):
-			f.update_idletasks()
-			x = f.winfo_x()
-			w = f.winfo_width()
-			positions.append((i, x, w))
-
-		if not positions:
-			return 0
-
-		for i, x, w in positions:
-			mid = x + w / 2
-			if x_in_inner < mid:
-				return i
-		return len(positions)
+		# Binary-search the cached midpoints from drag start
+		return bisect.bisect_left(self._drag_midpoints, x_in_inner)
 
 	def _show_insert_bar(self, index: int):
-		# Create or move a thin vertical bar at insertion index
+		# The bar widget is created once and only moved afterwards; destroying
+		# and recreating it per drag is one of the slowest things Tk can do.
+		# (A canvas rectangle won't work here: the inner frame is an embedded
+		# window item, and Tk always draws those above canvas drawing items.)
 		if self.insert_bar is None:
 			self.insert_bar = tk.Frame(self.row.inner, bg="#339af0", width=3)
-			self.insert_bar.place(y=0, relheight=1)
 
 		# Compute x position as left of target frame or after last
 		if index >= len(self.page_frames):
@@ -301,15 +588,14 @@ class PDFPageEditorApp(tk.Tk):
 			x = self.page_frames[index].winfo_x() - int(PAGE_FRAME_PADX / 2)
 			if x < 0:
 				x = 0
-		self.insert_bar.place_configure(x=x)
+		self.insert_bar.place_configure(x=x, y=0, relheight=1)
+		self.insert_bar.lift()
 
 	def _hide_insert_bar(self):
 		if self.insert_bar is not None:
 			self.insert_bar.place_forget()
-			self.insert_bar.destroy()
-			self.insert_bar = None
 
-	def _on_release(self, _event, frame: tk.Widget):
+	def _on_release(self, _event):
 		if not self.dragging or self.drop_index is None:
 			return
 
@@ -328,20 +614,29 @@ class PDFPageEditorApp(tk.Tk):
 		if dest < 0:
 			dest = 0
 
-		# Extract selected items
-		pages_to_move = [self.pages[i] for i in sel]
-		frames_to_move = [self.page_frames[i] for i in sel]
+		# Extract selected rows from every parallel array
+		arrays = (
+			self._page_paths,
+			self._page_indices,
+			self._page_photos,
+			self._page_thumb_sizes,
+			self._page_include,
+			self.page_frames,
+		)
+		rows_to_move = [tuple(a[i] for a in arrays) for i in sel]
 
 		# Remove from current lists (delete from highest to lowest index)
 		for i in reversed(sel):
-			del self.pages[i]
-			f = self.page_frames.pop(i)
+			f = self.page_frames[i]
 			f.grid_forget()
+			self._current_columns.pop(f, None)
+			for a in arrays:
+				del a[i]
 
 		# Insert at destination preserving order
-		for offset, (p, f) in enumerate(zip(pages_to_move, frames_to_move)):
-			self.pages.insert(dest + offset, p)
-			self.page_frames.insert(dest + offset, f)
+		for offset, row in enumerate(rows_to_move):
+			for a, value in zip(arrays, row):
+				a.insert(dest + offset, value)
 
 		# Rebuild grid and selection indices
 		self._layout_page_frames()
@@ -354,22 +649,25 @@ class PDFPageEditorApp(tk.Tk):
 		self.dragging = False
 		self.drag_start_index = None
 		self.drop_index = None
+		self._drag_midpoints = array.array("i")
+		self._pending_drag_x = None
 
 	def _index_from_frame_or_child(self, widget: tk.Widget) -> int:
-		# Walk up parents until we find the page frame
+		# Walk up parents until we find a page frame; dict lookup keeps this O(1)
 		current = widget
-		while current is not None and current not in self.page_frames:
+		while current is not None:
+			index = self._frame_to_index.get(current)
+			if index is not None:
+				return index
 			try:
 				current = current.master
 			except Exception:
 				break
-		if current in self.page_frames:
-			return self.page_frames.index(current)
 		return -1
 
 	# ---------- Export ----------
 	def on_export(self):
-		if not self.pages:
+		if not self._page_paths:
 			messagebox.showinfo("Export", "No pages to export.")
 			return
 		if PdfReader is None or PdfWriter is None:
@@ -384,31 +682,76 @@ class PDFPageEditorApp(tk.Tk):
 		if not out_path:
 			return
 
-		try:
-			self._export_pdf(out_path)
-			self.status.set(f"Exported to {out_path}")
-		except Exception as e:
-			messagebox.showerror("Export failed", f"Could not export PDF:\n{e}")
-
-	def _export_pdf(self, out_path: str):
-		writer = PdfWriter()
+		# Snapshot page order/includes on the Tk thread; the worker only sees
+		# plain tuples, so edits during export can't corrupt the output
+		rows = [
+			(self._page_paths[i], self._page_indices[i])
+			for i in range(len(self._page_paths))
+			if self._page_include[i].get()
+		]
+		if not rows:
+			messagebox.showinfo("Export", "No pages selected for export.")
+			return
 
-		# Cache readers by source path
-		readers = {}
+		self.export_button.configure(state=tk.DISABLED)
+		self.status.set("Exporting...")
+		threading.Thread(target=self._export_pdf_worker, args=(out_path, rows), daemon=True).start()
+
+	def _get_reader(self, path: str):
+		# Reuse parsed readers across exports; re-parse only if the file changed
+		mtime = os.path.getmtime(path)
+		cached = self._reader_cache.get(path)
+		if cached is not None and cached[0] == mtime:
+			return cached[1]
+		reader = PdfReader(path)
+		self._reader_cache[path] = (mtime, reader)
+		return reader
+
+	def _prewarm_readers(self, file_paths: Tuple[str, ...]):
+		# Parse off the Tk thread so the first export pays no xref cost
+		for path in file_paths:
+			try:
+				self._get_reader(path)
+			except Exception:
+				pass  # export will surface the real error
 
-		for item in self.pages:
-			if not item.include_var.get():
-				continue
-			if item.source_path not in readers:
-				readers[item.source_path] = PdfReader(item.source_path)
-			reader = readers[item.source_path]
-			writer.add_page(reader.pages[item.page_index])
+	def _export_pdf_worker(self, out_path: str, rows: List[Tuple[str, int]]):
+		# Runs off the Tk thread; pypdf is pure Python and I/O bound
+		try:
+			writer = PdfWriter()
+			total = len(rows)
+			# Pages duplicated in the reel are copied into the writer once and
+			# re-added by reference, so their object trees aren't cloned again
+			seen: dict = {}  # (path, page_index) -> writer's PageObject
+			for n, (path, page_index) in enumerate(rows, start=1):
+				prev = seen.get((path, page_index))
+				if prev is not None:
+					writer.add_page(prev)
+				else:
+					reader = self._get_reader(path)
+					seen[(path, page_index)] = writer.add_page(reader.pages[page_index])
+				self.after(0, self.status.set, f"Writing page {n}/{total}...")
+
+			# Serialize into a spooled buffer (in memory up to 256 MB), then dump
+			# to disk in large sequential writes instead of pypdf's many small ones
+			with tempfile.SpooledTemporaryFile(max_size=256 * 1024 * 1024) as buf:
+				writer.write(buf)
+				buf.seek(0)
+				with open(out_path, "wb") as f:
+					shutil.copyfileobj(buf, f, 1024 * 1024)
+		except Exception as e:
+			self.after(0, self._export_failed, e)
+			return
+		self.after(0, self._export_done, out_path)
 
-		if len(writer.pages) == 0:
-			raise RuntimeError("No pages selected for export.")
+	def _export_done(self, out_path: str):
+		self.export_button.configure(state=tk.NORMAL)
+		self.status.set(f"Exported to {out_path}")
 
-		with open(out_path, "wb") as f:
-			writer.write(f)
+	def _export_failed(self, error: Exception):
+		self.export_button.configure(state=tk.NORMAL)
+		self.status.set("Export failed")
+		messagebox.showerror("Export failed", f"Could not export PDF:\n{error}")
 
 
 def main():